@@ -11,9 +11,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Sequence
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 
 # -----------------------------
@@ -21,7 +23,7 @@ from typing import List, Optional, Sequence
 # -----------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DayPlan:
     date: date
     label: str
@@ -43,13 +45,25 @@ class PlanConfig:
     peak_long_done: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanDetails:
     plans: List[DayPlan]
     stage3_used: int
     stage3_inferred: bool
     peak_long_done: bool
     peak_long_inferred: bool
+    phase: str = ""
+    target_weekly_km: float = 0.0
+
+
+@dataclass(slots=True)
+class MacroWeek:
+    week_start: date
+    phase: str
+    target_weekly_km: float
+    long_run_km: float
+    quality_km: float
+    easy_km: float
 
 
 # -----------------------------
@@ -60,10 +74,29 @@ class PlanDetails:
 WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 QUALITY_DAY_PRIORITY = [1, 3, 4, 2, 5, 0, 6]
 EASY_DAY_PRIORITY = [0, 2, 4, 5, 3, 1, 6]
+# 레이스까지 남은 일수 경계(3/6/10주)와 구간별 Phase. 경계 일수는 상위 Phase에 속한다.
+PHASE_DAY_THRESHOLDS = (21, 42, 70)
+PHASES_BY_THRESHOLD = ("TAPER", "PEAK", "BUILD", "BASE")
+# 피로도 경계(4/6/8)별 주간 목표 거리 계수
+FATIGUE_LEVEL_THRESHOLDS = (4, 6, 8)
+FATIGUE_VOLUME_FACTORS = (1.0, 0.9, 0.85, 0.8)
+# BASE 단계 롱런: 최근 롱런 경계(18/22/24km)별 권장 거리
+BASE_LONG_RUN_THRESHOLDS = (18.0, 22.0, 24.0)
+BASE_LONG_RUN_KM = (18.0, 20.0, 22.0, 24.0)
+MIN_LONG_KM_BY_PHASE = {
+    "BASE": 18.0,
+    "BUILD": 20.0,
+    "PEAK": 24.0,
+    "TAPER": 4.0,
+}
 
 
 def parse_date(value: str) -> date:
-    return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+    value = value.strip()
+    # 0으로 채운 YYYY-MM-DD는 fromisoformat으로 바로 읽고, 그 외(2025-1-5 등)는 strptime으로 처리한다.
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
 
 
 def start_of_week(d: date) -> date:
@@ -74,6 +107,59 @@ def round_km(x: float) -> float:
     return round(x, 1)
 
 
+LONG_RUN_DAY_INDEX = 6  # 롱런은 항상 일요일
+# 롱런 요일을 뺀 나머지 요일 비트 (bit i = Mon+i)
+NON_LONG_DAYS_MASK = 0b1111111 & ~(1 << LONG_RUN_DAY_INDEX)
+
+
+def _day_index_masks(quality_count: int, easy_sessions: int) -> Tuple[int, int]:
+    """Return 7-bit weekday masks (bit i = Mon+i) for quality and easy days."""
+    available = NON_LONG_DAYS_MASK
+    quality_mask = easy_mask = 0
+    for d in QUALITY_DAY_PRIORITY:
+        if quality_count <= 0:
+            break
+        if available >> d & 1:
+            quality_mask |= 1 << d
+            available &= ~(1 << d)
+            quality_count -= 1
+    for d in EASY_DAY_PRIORITY:
+        if easy_sessions <= 0:
+            break
+        if available >> d & 1:
+            easy_mask |= 1 << d
+            available &= ~(1 << d)
+            easy_sessions -= 1
+    return quality_mask, easy_mask
+
+
+def _week_day_types(quality_count: int, easy_sessions: int, long_scheduled: bool) -> Tuple[str, ...]:
+    quality_mask, easy_mask = _day_index_masks(quality_count, easy_sessions)
+    day_types = []
+    for i in range(7):
+        if i == LONG_RUN_DAY_INDEX and long_scheduled:
+            day_types.append("LONG")
+        elif quality_mask >> i & 1:
+            day_types.append("QUALITY")
+        elif easy_mask >> i & 1:
+            day_types.append("EASY")
+        else:
+            day_types.append("REST")
+    return tuple(day_types)
+
+
+# 롱런 요일을 뺀 후보는 6일뿐이므로 (품질 횟수, easy 횟수, 롱런 여부) 조합별 요일 배치를
+# import 시 모두 계산해 둔다.
+WEEK_DAY_TYPES: Dict[Tuple[int, int, bool], Tuple[str, ...]] = {
+    (quality_count, easy_sessions, long_scheduled): _week_day_types(
+        quality_count, easy_sessions, long_scheduled
+    )
+    for quality_count in range(7)
+    for easy_sessions in range(7)
+    for long_scheduled in (False, True)
+}
+
+
 # -----------------------------
 # Phase / 목표 거리
 # -----------------------------
@@ -81,14 +167,7 @@ def round_km(x: float) -> float:
 
 def determine_phase(today: date, race_date: date) -> str:
     days_left = (race_date - today).days
-    weeks_left = days_left / 7.0
-    if weeks_left >= 10:
-        return "BASE"
-    if 6 <= weeks_left < 10:
-        return "BUILD"
-    if 3 <= weeks_left < 6:
-        return "PEAK"
-    return "TAPER"
+    return PHASES_BY_THRESHOLD[bisect_right(PHASE_DAY_THRESHOLDS, days_left)]
 
 
 def compute_target_weekly_km(
@@ -117,14 +196,7 @@ def compute_target_weekly_km(
 
 def adjust_target_for_fatigue(target: float, fatigue_level: int) -> float:
     """Apply 10~20% reduction based on fatigue to keep workload manageable."""
-    if fatigue_level >= 8:
-        factor = 0.8
-    elif fatigue_level >= 6:
-        factor = 0.85
-    elif fatigue_level >= 4:
-        factor = 0.9
-    else:
-        factor = 1.0
+    factor = FATIGUE_VOLUME_FACTORS[bisect_right(FATIGUE_LEVEL_THRESHOLDS, fatigue_level)]
     adjusted = round_km(target * factor)
     return max(20.0, adjusted)
 
@@ -142,10 +214,16 @@ def _normalize_history(history: Sequence[float], fallback: float) -> List[float]
 
 
 def estimate_stage3_count(history: Sequence[float], fallback: float) -> int:
-    recent = _normalize_history(history, fallback)
-    max_run = max(recent)
-    heavy = sum(1 for d in recent if d >= 26)
-    moderate = sum(1 for d in recent if 24 <= d < 26)
+    # 최근 롱런의 최댓값과 26km+ / 24~26km 횟수를 한 번의 순회로 구한다.
+    max_run = 0.0
+    heavy = moderate = 0
+    for d in _normalize_history(history, fallback):
+        if d > max_run:
+            max_run = d
+        if d >= 26:
+            heavy += 1
+        elif d >= 24:
+            moderate += 1
 
     if max_run < 22:
         return 0
@@ -166,6 +244,8 @@ def infer_peak_long_done(recent_long_run: float, weeks_left: float) -> bool:
     return False
 
 
+# 입력이 모두 hashable 스칼라인 순수 함수라 같은 조건의 반복 호출은 캐시에서 바로 돌려준다.
+@lru_cache(maxsize=4096)
 def select_long_run_distance(
     phase: str,
     weeks_left: float,
@@ -181,13 +261,7 @@ def select_long_run_distance(
         return 4.0
 
     if phase == "BASE":
-        if recent_long_run < 18:
-            return 18.0
-        if recent_long_run < 22:
-            return 20.0
-        if recent_long_run < 24:
-            return 22.0
-        return 24.0
+        return BASE_LONG_RUN_KM[bisect_right(BASE_LONG_RUN_THRESHOLDS, recent_long_run)]
 
     if phase == "BUILD":
         if recent_long_run < 20:
@@ -213,12 +287,7 @@ def select_long_run_distance(
 
 
 def min_long_distance_for_phase(phase: str) -> float:
-    return {
-        "BASE": 18.0,
-        "BUILD": 20.0,
-        "PEAK": 24.0,
-        "TAPER": 4.0,
-    }.get(phase, 18.0)
+    return MIN_LONG_KM_BY_PHASE.get(phase, 18.0)
 
 
 # -----------------------------
@@ -409,46 +478,29 @@ def generate_week_plan(config: PlanConfig) -> PlanDetails:
         easy_volume / easy_sessions if easy_sessions > 0 else 0.0
     )
 
-    long_run_day_index = 6
-    long_run_scheduled = long_slot == 1
+    day_types = WEEK_DAY_TYPES[(min(quality_count, 6), min(easy_sessions, 6), long_slot == 1)]
 
-    quality_day_indices = [
-        d for d in QUALITY_DAY_PRIORITY if d != long_run_day_index
-    ][:quality_count]
-    easy_day_indices = [
-        d
-        for d in EASY_DAY_PRIORITY
-        if d not in quality_day_indices and d != long_run_day_index
-    ][:easy_sessions]
+    # 세션 종류별 거리·설명은 주 안에서 같으므로 요일 루프 전에 한 번만 반올림/포맷한다.
+    sessions = {
+        "LONG": (f"롱런 {long_run_km:.1f}km (일요일)", round_km(long_run_km)),
+        "QUALITY": (
+            f"{quality_type_for_phase(phase)} ~{quality_km_each:.1f}km",
+            round_km(quality_km_each),
+        ),
+        "EASY": ("Easy 러닝", round_km(easy_km_each)),
+        "REST": ("휴식 또는 크로스 트레이닝", 0.0),
+    }
 
     plans: List[DayPlan] = []
-    for i in range(7):
-        current_date = start + timedelta(days=i)
-        label = WEEKDAY_LABELS[i]
-        if i == long_run_day_index and long_run_scheduled:
-            plan_type = "LONG"
-            desc = f"롱런 {long_run_km:.1f}km (일요일)"
-            km = long_run_km
-        elif i in quality_day_indices:
-            plan_type = "QUALITY"
-            desc = f"{quality_type_for_phase(phase)} ~{quality_km_each:.1f}km"
-            km = quality_km_each
-        elif i in easy_day_indices:
-            plan_type = "EASY"
-            desc = "Easy 러닝"
-            km = easy_km_each
-        else:
-            plan_type = "REST"
-            desc = "휴식 또는 크로스 트레이닝"
-            km = 0.0
-
+    for i, plan_type in enumerate(day_types):
+        desc, km = sessions[plan_type]
         plans.append(
             DayPlan(
-                date=current_date,
-                label=label,
+                date=start + timedelta(days=i),
+                label=WEEKDAY_LABELS[i],
                 type=plan_type,
                 description=desc,
-                planned_km=round_km(km),
+                planned_km=km,
             )
         )
 
@@ -458,9 +510,62 @@ def generate_week_plan(config: PlanConfig) -> PlanDetails:
         stage3_inferred=stage3_inferred,
         peak_long_done=peak_long_done,
         peak_long_inferred=peak_inferred,
+        phase=phase,
+        target_weekly_km=target_weekly_km,
     )
 
 
+def generate_macro_plan(config: PlanConfig) -> List[MacroWeek]:
+    """config.today부터 race_date까지 주마다 한 줄씩 요약한다.
+
+    각 주의 계획 결과를 다음 주 입력으로 넘긴다 (generate_multi_week_plan_v1_2와 같은 방식).
+    - recent_weekly_km: 직전 주 계획 총 거리
+    - recent_long_run / long_run_history: 직전 주 롱런 거리 (최근 6회 유지)
+    - stage3_count: 직접 입력한 경우 26km 이상 롱런마다 +1 (최대 3), 아니면 히스토리로 재추정
+    - peak_long_done: 30km 이상 롱런이 계획되면 True
+    fatigue_level은 미래 값을 알 수 없으므로 입력값을 그대로 유지한다.
+    """
+    weeks: List[MacroWeek] = []
+    week_config = config
+    history = list(config.long_run_history) if config.long_run_history else [config.recent_long_run]
+    while week_config.today <= config.race_date:
+        details = generate_week_plan(week_config)
+        km_by_type = {"LONG": 0.0, "QUALITY": 0.0, "EASY": 0.0, "REST": 0.0}
+        for plan in details.plans:
+            km_by_type[plan.type] += plan.planned_km
+        long_km = km_by_type["LONG"]
+        weeks.append(
+            MacroWeek(
+                week_start=start_of_week(week_config.today),
+                phase=details.phase,
+                target_weekly_km=details.target_weekly_km,
+                long_run_km=round_km(long_km),
+                quality_km=round_km(km_by_type["QUALITY"]),
+                easy_km=round_km(km_by_type["EASY"]),
+            )
+        )
+
+        # 이번 주 계획을 다음 주의 "최근 기록"으로 넘긴다.
+        stage3_count = week_config.stage3_count
+        peak_long_done = week_config.peak_long_done
+        if long_km > 0:
+            history = (history + [long_km])[-6:]
+            if stage3_count is not None and long_km >= 26:
+                stage3_count = min(stage3_count + 1, 3)
+            if long_km >= 30:
+                peak_long_done = True
+        week_config = replace(
+            week_config,
+            today=week_config.today + timedelta(days=7),
+            recent_weekly_km=sum(km_by_type.values()),
+            recent_long_run=long_km if long_km > 0 else week_config.recent_long_run,
+            long_run_history=list(history),
+            stage3_count=stage3_count,
+            peak_long_done=peak_long_done,
+        )
+    return weeks
+
+
 # -----------------------------
 # CLI
 # -----------------------------
@@ -554,13 +659,8 @@ def gather_config_from_cli() -> PlanConfig:
 
 def main() -> None:
     config = gather_config_from_cli()
-    phase = determine_phase(config.today, config.race_date)
-    weeks_left = (config.race_date - config.today).days / 7.0
-    target = compute_target_weekly_km(phase, config.recent_weekly_km, weeks_left)
-    target = adjust_target_for_fatigue(target, config.fatigue_level)
-
     details = generate_week_plan(config)
-    print_week_plan(details, target)
+    print_week_plan(details, details.target_weekly_km)
 
 
 if __name__ == "__main__":
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Tuple, Dict
+from enum import IntEnum
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 
 
 # -----------------------------
@@ -19,7 +21,27 @@ from typing import List, Optional, Tuple, Dict
 # -----------------------------
 
 
-@dataclass
+class SessionKind(IntEnum):
+    REST = 0
+    EASY = 1
+    QUALITY = 2
+    LONG = 3
+    OTHER = 4  # 위 접두어에 해당하지 않는 임의의 session_type
+
+
+def session_kind_for(session_type: str) -> SessionKind:
+    if session_type.startswith("Long"):
+        return SessionKind.LONG
+    if session_type.startswith("Quality"):
+        return SessionKind.QUALITY
+    if session_type.startswith("Easy"):
+        return SessionKind.EASY
+    if session_type.startswith("Rest"):
+        return SessionKind.REST
+    return SessionKind.OTHER
+
+
+@dataclass(slots=True)
 class DayPlan:
     date: date
     weekday: str
@@ -29,17 +51,25 @@ class DayPlan:
     structure: str
     notes: str
     safety_overrides: List[str] = field(default_factory=list)
+    # 세션 구분 태그. 빌더가 직접 지정하고, 생략하면 session_type 접두어로 한 번만 판정한다.
+    kind: Optional[SessionKind] = None
+
+    def __post_init__(self) -> None:
+        if self.kind is None:
+            self.kind = session_kind_for(self.session_type)
 
     def formatted_description(self) -> str:
-        return (
-            f"{self.date.strftime('%Y-%m-%d')} ({self.weekday}) | "
-            f"{self.session_type} | {self.distance_km:.1f} km | "
-            f"Pace {self.pace_range} | {self.structure} | Notes: {self.notes} "
-            f"{'(Safety: ' + '; '.join(self.safety_overrides) + ')' if self.safety_overrides else ''}"
-        )
+        parts = [
+            self.date.isoformat(),
+            f" ({self.weekday}) | {self.session_type} | {self.distance_km:.1f} km | ",
+            f"Pace {self.pace_range} | {self.structure} | Notes: {self.notes} ",
+        ]
+        if self.safety_overrides:
+            parts.append(f"(Safety: {'; '.join(self.safety_overrides)})")
+        return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanConfig:
     today: date
     race_date: date
@@ -60,7 +90,7 @@ class PlanConfig:
     stage4_completed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanResult:
     goal_mode: str
     target_weekly_km: float
@@ -69,7 +99,7 @@ class PlanResult:
     notes: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyContext:
     pain_48h: bool
     fatigue_streak: int
@@ -79,6 +109,18 @@ class SafetyContext:
 
 WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 QUALITY_DAY_OPTIONS = [1, 3, 5]  # Tue/Thu/Sat
+DAY_OFFSETS: Tuple[timedelta, ...] = tuple(timedelta(days=i) for i in range(7))
+EASY_DEFAULT_PACE = "유연 (목표 MP 기반 +45~90초)"
+# Goal Mode별 주간 거리 상한 (km)
+GOAL_MODE_WEEKLY_CAPS = {"G1": 60.0, "G2": 75.0, "G3": 82.0}
+# 롱런 Stage별 기본 거리 (TAPER 제외)
+LONG_RUN_STAGE_KM = {1: 20.0, 2: 24.0, 3: 28.0, 4: 32.0}
+# 롱런 후반 MP 비율: Stage4 / Stage3 / 그 외 Stage
+LONG_RUN_MP_RATIOS = {
+    4: {"G1": 0.0, "G2": 0.25, "G3": 0.35},
+    3: {"G1": 0.0, "G2": 0.2, "G3": 0.3},
+}
+DEFAULT_LONG_RUN_MP_RATIO = {"G1": 0.0, "G2": 0.15, "G3": 0.2}
 
 
 # -----------------------------
@@ -86,13 +128,27 @@ QUALITY_DAY_OPTIONS = [1, 3, 5]  # Tue/Thu/Sat
 # -----------------------------
 
 
+@lru_cache(maxsize=256)
 def pace_to_seconds(pace_str: str) -> float:
     minutes, seconds = pace_str.strip().split(":")
     return int(minutes) * 60 + int(seconds)
 
 
+# 정수 초 페이스(1:00~14:59/km) 문자열을 import 시 미리 만들어 둔다.
+PACE_STRING_MIN_SEC = 60
+PACE_STRING_MAX_SEC = 900
+PACE_STRINGS: Tuple[str, ...] = tuple(
+    f"{s // 60}:{s % 60:02d}/km" for s in range(PACE_STRING_MIN_SEC, PACE_STRING_MAX_SEC)
+)
+
+
 def seconds_to_pace(sec: float) -> str:
     sec = max(sec, 0)
+    if PACE_STRING_MIN_SEC <= sec < PACE_STRING_MAX_SEC:
+        whole = int(sec)
+        if whole == sec:
+            return PACE_STRINGS[whole - PACE_STRING_MIN_SEC]
+    # 소수 초나 범위 밖 값은 기존 계산을 그대로 따른다.
     minutes = int(sec // 60)
     seconds = int(round(sec % 60))
     return f"{minutes}:{seconds:02d}/km"
@@ -119,6 +175,12 @@ def compute_goal_mode(mp_target: float, mp_current: float) -> str:
 
 
 def compute_paces(goal_mode: str, mp_target: float) -> Dict[str, str]:
+    # 캐시된 결과를 새 dict로 감싸 호출자가 수정해도 캐시가 오염되지 않게 한다.
+    return dict(_compute_paces_cached(goal_mode, mp_target))
+
+
+@lru_cache(maxsize=128)
+def _compute_paces_cached(goal_mode: str, mp_target: float) -> Tuple[Tuple[str, str], ...]:
     easy_offsets = {
         "G1": (70, 100),
         "G2": (55, 85),
@@ -140,7 +202,7 @@ def compute_paces(goal_mode: str, mp_target: float) -> Dict[str, str]:
 
     for stage, offsets in long_stage_offsets.items():
         paces[f"long_stage_{stage}"] = format_range(mp_target, *offsets)
-    return paces
+    return tuple(paces.items())
 
 
 # -----------------------------
@@ -148,61 +210,66 @@ def compute_paces(goal_mode: str, mp_target: float) -> Dict[str, str]:
 # -----------------------------
 
 
+def _downgrade_to_easy(plan: DayPlan, distance: float, notes: str) -> None:
+    # build_easy_session과 같은 내용으로 기존 DayPlan을 제자리에서 Easy 세션으로 바꾼다.
+    plan.session_type = "Easy Run"
+    plan.distance_km = distance
+    plan.pace_range = EASY_DEFAULT_PACE
+    plan.structure = f"Easy jog {distance:.1f}km"
+    plan.notes = notes
+    plan.kind = SessionKind.EASY
+
+
 def apply_safety_overrides(
     plan: DayPlan,
     context: SafetyContext,
     fatigue_level: int,
 ) -> DayPlan:
-    overrides = []
-
     if context.pain_48h:
-        overrides.append("48시간 통증 → 강훈 금지")
         plan.session_type = "Rest / Recovery"
+        plan.kind = SessionKind.REST
         plan.distance_km = 0.0
         plan.structure = "Complete Rest (통증 관리)"
         plan.pace_range = "-"
+        # 휴식으로 바뀐 뒤에는 품질 세션 대상 스위치가 더 적용될 수 없다.
+        plan.safety_overrides.append("48시간 통증 → 강훈 금지")
+        return plan
 
-    if context.fatigue_streak >= 3 and plan.session_type.startswith("Quality"):
-        overrides.append("3일 연속 피로 → Easy 전환")
-        plan = build_easy_session(
-            plan.date,
-            plan.weekday,
-            plan.distance_km or 8.0,
-            "피로 누적 안전 스위치",
-        )
-
-    if context.prev_day_altitude > 300 and plan.session_type.startswith("Quality"):
-        overrides.append("전날 고도 >300m → Easy 전환")
-        plan = build_easy_session(
-            plan.date,
-            plan.weekday,
-            max(plan.distance_km, 8.0),
-            "고도 회복 모드",
-        )
-
-    if context.hr_delta_percent and context.hr_delta_percent >= 8:
-        if plan.session_type.startswith("Quality"):
-            overrides.append("HR +8% → 품질 금지")
-            plan = build_easy_session(
-                plan.date, plan.weekday, plan.distance_km or 6.0, "HR 안정화"
-            )
+    if plan.kind != SessionKind.QUALITY:
+        return plan
 
-    if fatigue_level >= 7 and plan.session_type.startswith("Quality"):
-        overrides.append("피로도 7 이상 → 품질 금지")
-        plan = build_easy_session(
-            plan.date, plan.weekday, plan.distance_km or 6.0, "고피로 회복"
-        )
+    # 품질 세션은 처음 걸린 스위치 하나로 Easy 전환되고, 이후 스위치는 적용 대상이 아니다.
+    if context.fatigue_streak >= 3:
+        reason = "3일 연속 피로 → Easy 전환"
+        distance = plan.distance_km or 8.0
+        notes = "피로 누적 안전 스위치"
+    elif context.prev_day_altitude > 300:
+        reason = "전날 고도 >300m → Easy 전환"
+        distance = max(plan.distance_km, 8.0)
+        notes = "고도 회복 모드"
+    elif context.hr_delta_percent and context.hr_delta_percent >= 8:
+        reason = "HR +8% → 품질 금지"
+        distance = plan.distance_km or 6.0
+        notes = "HR 안정화"
+    elif fatigue_level >= 7:
+        reason = "피로도 7 이상 → 품질 금지"
+        distance = plan.distance_km or 6.0
+        notes = "고피로 회복"
+    else:
+        return plan
 
-    plan.safety_overrides.extend(overrides)
+    _downgrade_to_easy(plan, distance, notes)
+    plan.safety_overrides.append(reason)
     return plan
 
 
 def estimate_session_altitude(plan: DayPlan, default_gain: float) -> float:
-    if plan.session_type.startswith("Long"):
+    kind = plan.kind
+    if kind == SessionKind.LONG:
         return max(350.0, default_gain)
-    if plan.session_type.startswith("Quality"):
+    if kind == SessionKind.QUALITY:
         return 250.0
-    if plan.session_type.startswith("Easy"):
+    if kind == SessionKind.EASY:
         return min(default_gain, 150.0)
     return 50.0
 
@@ -224,9 +291,10 @@ def build_easy_session(
         weekday=weekday,
         session_type="Easy Run",
         distance_km=distance,
-        pace_range=pace or "유연 (목표 MP 기반 +45~90초)",
+        pace_range=pace or EASY_DEFAULT_PACE,
         structure=f"Easy jog {distance:.1f}km",
         notes=notes,
+        kind=SessionKind.EASY,
     )
 
 
@@ -247,6 +315,7 @@ def build_point_session(
         pace_range=pace_range,
         structure=structure,
         notes=purpose,
+        kind=SessionKind.QUALITY,
     )
 
 
@@ -258,12 +327,7 @@ def build_long_run_structure(
     pace_range: str,
     goal_mode: str,
 ) -> DayPlan:
-    if stage == 4:
-        mp_ratio = {"G1": 0.0, "G2": 0.25, "G3": 0.35}[goal_mode]
-    elif stage == 3:
-        mp_ratio = {"G1": 0.0, "G2": 0.2, "G3": 0.3}[goal_mode]
-    else:
-        mp_ratio = {"G1": 0.0, "G2": 0.15, "G3": 0.2}[goal_mode]
+    mp_ratio = LONG_RUN_MP_RATIOS.get(stage, DEFAULT_LONG_RUN_MP_RATIO)[goal_mode]
 
     mp_distance = distance * mp_ratio
     warmup = distance - mp_distance
@@ -282,6 +346,7 @@ def build_long_run_structure(
         pace_range=pace_range,
         structure=structure,
         notes=notes,
+        kind=SessionKind.LONG,
     )
 
 
@@ -319,8 +384,7 @@ class Planner:
 
     def adjusted_target_volume(self) -> float:
         base = min(self.config.recent_weekly_km * 1.1, 82)
-        goal_caps = {"G1": 60.0, "G2": 75.0, "G3": 82.0}
-        capped = min(base, goal_caps[self.goal_mode])
+        capped = min(base, GOAL_MODE_WEEKLY_CAPS[self.goal_mode])
         fatigue_adjustment = 0.8 if self.config.fatigue_level >= 7 else 1.0
         return capped * fatigue_adjustment
 
@@ -352,26 +416,27 @@ class Planner:
             return 3
         return stage
 
-    def schedule_days(self, quality_count: int) -> Dict[int, str]:
-        plan = {i: "Rest" for i in range(7)}
+    def schedule_days(self, quality_count: int) -> bytearray:
+        # 요일 인덱스(0=Mon)별 SessionKind 코드. 0(REST)으로 초기화된 7바이트 버퍼.
+        plan = bytearray(7)
         run_days = min(self.config.weekly_frequency, 6)
 
         long_day = 6
-        plan[long_day] = "Long"
+        plan[long_day] = SessionKind.LONG
         run_days -= 1
 
         assigned_quality = 0
         for idx in QUALITY_DAY_OPTIONS:
             if assigned_quality >= quality_count or run_days <= 0:
                 break
-            plan[idx] = "Quality"
+            plan[idx] = SessionKind.QUALITY
             assigned_quality += 1
             run_days -= 1
 
         i = 0
         while run_days > 0 and i < 7:
-            if plan[i] == "Rest":
-                plan[i] = "Easy"
+            if plan[i] == SessionKind.REST:
+                plan[i] = SessionKind.EASY
                 run_days -= 1
             i += 1
 
@@ -397,34 +462,42 @@ class Planner:
         )
 
         plans: List[DayPlan] = []
+        easy_plans: List[DayPlan] = []
         remaining_easy_volume = max(target_km - long_distance, 0.0)
-        easy_sessions_planned = list(schedule.values()).count("Easy")
+        easy_sessions_planned = schedule.count(SessionKind.EASY)
         easy_distance_default = (
             remaining_easy_volume / max(easy_sessions_planned, 1)
             if easy_sessions_planned > 0
             else 0.0
         )
 
+        # 루프에서 바뀌지 않는 값은 지역 변수로 한 번만 읽어 둔다.
+        today = self.config.today
+        fatigue_level = self.config.fatigue_level
+        default_gain = self.config.altitude_gain_recent / max(self.config.weekly_frequency, 1)
+        day_offsets = DAY_OFFSETS
+        weekday_labels = WEEKDAY_LABELS
         for i in range(7):
-            current_date = self.config.today + timedelta(days=i)
-            session_label = schedule[i]
-            if session_label == "Long":
+            current_date = today + day_offsets[i]
+            label = weekday_labels[i]
+            session_kind = schedule[i]
+            if session_kind == SessionKind.LONG:
                 plan = build_long_run_structure(
                     current_date,
-                    WEEKDAY_LABELS[i],
+                    label,
                     stage,
                     long_distance,
                     self.paces[f"long_stage_{stage}"],
                     self.goal_mode,
                 )
-            elif session_label == "Quality":
+            elif session_kind == SessionKind.QUALITY:
                 plan = self.build_point_training_session(
-                    current_date, WEEKDAY_LABELS[i]
+                    current_date, label
                 )
-            elif session_label == "Easy":
+            elif session_kind == SessionKind.EASY:
                 plan = build_easy_session(
                     current_date,
-                    WEEKDAY_LABELS[i],
+                    label,
                     max(easy_distance_default, 6.0),
                     "기본 Easy 세션",
                     self.paces["easy"],
@@ -432,31 +505,28 @@ class Planner:
             else:
                 plan = DayPlan(
                     date=current_date,
-                    weekday=WEEKDAY_LABELS[i],
+                    weekday=label,
                     session_type="Rest / Mobility",
                     distance_km=0.0,
                     pace_range="-",
                     structure="Mobility + 스트레칭",
                     notes="완전 회복",
+                    kind=SessionKind.REST,
                 )
 
-            plan = apply_safety_overrides(
-                plan, safety_context, self.config.fatigue_level
-            )
+            plan = apply_safety_overrides(plan, safety_context, fatigue_level)
             plans.append(plan)
+            if plan.kind == SessionKind.EASY:
+                easy_plans.append(plan)
 
-            est_alt = estimate_session_altitude(
-                plan, self.config.altitude_gain_recent / max(self.config.weekly_frequency, 1)
-            )
-            safety_context.prev_day_altitude = est_alt
-            if plan.session_type.startswith("Easy") or plan.session_type.startswith(
-                "Rest"
-            ):
+            safety_context.prev_day_altitude = estimate_session_altitude(plan, default_gain)
+            # REST(0) / EASY(1)만 피로 연속 일수를 초기화한다.
+            if plan.kind <= SessionKind.EASY:
                 safety_context.fatigue_streak = 0
             else:
                 safety_context.fatigue_streak += 1
 
-        plans = self.balance_total_distance(plans, target_km)
+        plans = self.balance_total_distance(plans, target_km, easy_plans)
         total = sum(p.distance_km for p in plans)
         return PlanResult(
             goal_mode=self.goal_mode,
@@ -475,8 +545,7 @@ class Planner:
                 return 16.0
             return 22.0
 
-        distances = {1: 20.0, 2: 24.0, 3: 28.0, 4: 32.0}
-        return distances.get(stage, 20.0)
+        return LONG_RUN_STAGE_KM.get(stage, 20.0)
 
     def build_point_training_session(
         self, session_date: date, weekday: str
@@ -526,10 +595,15 @@ class Planner:
         )
 
     def balance_total_distance(
-        self, plans: List[DayPlan], target: float
+        self,
+        plans: List[DayPlan],
+        target: float,
+        easy_sessions: Optional[List[DayPlan]] = None,
     ) -> List[DayPlan]:
+        # easy_sessions: build_week가 안전 스위치 적용 후 모은 Easy 세션 (없으면 plans에서 다시 찾는다)
         total = sum(p.distance_km for p in plans)
-        easy_sessions = [p for p in plans if p.session_type.startswith("Easy")]
+        if easy_sessions is None:
+            easy_sessions = [p for p in plans if p.kind == SessionKind.EASY]
         if not easy_sessions:
             return plans
         diff = total - target
@@ -549,35 +623,35 @@ class Planner:
 # -----------------------------
 
 
-def prompt_float(message: str, default: float) -> float:
-    raw = input(f"{message} (Enter={default}): ").strip()
+T = TypeVar("T")
+
+
+def _prompt(message: str, default: T, parser: Callable[[str], T], hint: str = "") -> T:
+    # 빈 입력이나 파싱 실패 시 기본값을 돌려주는 공통 프롬프트
+    raw = input(f"{message} ({hint}Enter={default}): ").strip()
     if not raw:
         return default
     try:
-        return float(raw)
+        return parser(raw)
     except ValueError:
         return default
 
 
+def _parse_pace(raw: str) -> str:
+    pace_to_seconds(raw)
+    return raw
+
+
+def prompt_float(message: str, default: float) -> float:
+    return _prompt(message, default, float)
+
+
 def prompt_int(message: str, default: int) -> int:
-    raw = input(f"{message} (Enter={default}): ").strip()
-    if not raw:
-        return default
-    try:
-        return int(raw)
-    except ValueError:
-        return default
+    return _prompt(message, default, int)
 
 
 def prompt_pace(message: str, default: str) -> str:
-    raw = input(f"{message} (mm:ss, Enter={default}): ").strip()
-    if not raw:
-        return default
-    try:
-        pace_to_seconds(raw)
-        return raw
-    except ValueError:
-        return default
+    return _prompt(message, default, _parse_pace, "mm:ss, ")
 
 
 def gather_config_from_cli() -> PlanConfig:
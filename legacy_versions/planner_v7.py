@@ -13,9 +13,14 @@ Goal-mode 기반 · 단계별 강도 자동 조정 · 안전 스위치 내장형
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import argparse
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, fields, replace
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 # -----------------------------
@@ -35,17 +40,27 @@ class DayPlan:
     safety_overrides: List[str] = field(default_factory=list)
 
     def formatted(self) -> str:
-        info = (
-            f"{self.date:%Y-%m-%d} ({self.weekday}) | {self.session_type} | "
+        parts = [
+            f"{self.date.isoformat()} ({self.weekday}) | {self.session_type} | "
             f"{self.distance_km:.1f} km | Pace {self.pace_range} | {self.structure}"
-        )
-        note = f" | Notes: {self.notes}" if self.notes else ""
-        safe = (
-            f" | Safety: {', '.join(self.safety_overrides)}"
-            if self.safety_overrides
-            else ""
-        )
-        return info + note + safe
+        ]
+        if self.notes:
+            parts.append(f"Notes: {self.notes}")
+        if self.safety_overrides:
+            parts.append("Safety: " + ", ".join(self.safety_overrides))
+        return " | ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "date": self.date.isoformat(),
+            "weekday": self.weekday,
+            "session_type": self.session_type,
+            "distance_km": self.distance_km,
+            "pace_range": self.pace_range,
+            "structure": self.structure,
+            "notes": self.notes,
+            "safety_overrides": list(self.safety_overrides),
+        }
 
 
 @dataclass
@@ -70,6 +85,20 @@ class PlanResult:
     notes: List[str]
     plans: List[DayPlan]
 
+    def to_json(self) -> str:
+        """JSON 문자열로 직렬화한다. date 필드는 ISO(YYYY-MM-DD) 문자열로 기록된다."""
+        return json.dumps(
+            {
+                "goal_mode": self.goal_mode,
+                "phase": self.phase,
+                "target_weekly_km": self.target_weekly_km,
+                "total_planned_km": self.total_planned_km,
+                "notes": list(self.notes),
+                "plans": [plan.to_dict() for plan in self.plans],
+            },
+            ensure_ascii=False,
+        )
+
 
 @dataclass
 class SafetyContext:
@@ -79,6 +108,44 @@ class SafetyContext:
 
 WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 QUALITY_DAY_OPTIONS = [1, 3, 5]  # Tue/Thu/Sat 기본 품질 슬롯
+ALL_DAYS_MASK = 0b1111111
+LONG_DAY_BIT = 1 << 6  # 일요일 롱런
+
+# MP 대비 페이스 오프셋(초): (key, low, high). Easy만 Goal Mode에 따라 달라진다.
+EASY_OFFSETS = {
+    "G1": (70, 100),
+    "G2": (55, 85),
+    "G3": (45, 75),
+}
+PACE_OFFSETS = (
+    ("mp", -5, 5),
+    ("tempo", -25, -15),
+    ("interval", -65, -40),
+    ("taper", 5, 15),
+    ("long_1", 40, 70),
+    ("long_2", 25, 55),
+    ("long_3", 15, 45),
+    ("long_4", 5, 25),
+)
+
+# 남은 주 수 경계(이상이면 다음 Phase): <3 TAPER, 3~6 PEAK, 6~10 BUILD, 10+ BASE
+PHASE_WEEK_THRESHOLDS = (3.0, 6.0, 10.0)
+PHASES_BY_THRESHOLD = ("TAPER", "PEAK", "BUILD", "BASE")
+# Phase별 롱런 Stage: (최근 롱런 기준 km, 기준 미만 Stage, 기준 이상 Stage). TAPER는 Stage2.
+STAGE_BY_PHASE = {
+    "BASE": (22.0, 1, 2),
+    "BUILD": (24.0, 2, 3),
+    "PEAK": (30.0, 3, 4),
+}
+
+GOAL_MODE_INDEX = {"G1": 0, "G2": 1, "G3": 2}
+# 롱런 Stage1~4별 후반 MP 비율 (G1, G2, G3)
+LONG_RUN_MP_RATIO = (
+    (0.0, 0.0, 0.0),
+    (0.0, 0.2, 0.3),
+    (0.0, 0.2, 0.3),
+    (0.0, 0.25, 0.35),
+)
 
 
 # -----------------------------
@@ -87,7 +154,9 @@ QUALITY_DAY_OPTIONS = [1, 3, 5]  # Tue/Thu/Sat 기본 품질 슬롯
 
 
 def pace_to_seconds(pace_str: str) -> float:
-    minute, sec = pace_str.strip().split(":")
+    minute, sep, sec = pace_str.strip().partition(":")
+    if not sep:
+        raise ValueError(f"Invalid pace format: {pace_str!r}")
     return int(minute) * 60 + int(sec)
 
 
@@ -102,15 +171,25 @@ def format_range(base: float, low_offset: float, high_offset: float) -> str:
     return f"{seconds_to_pace(base + low_offset)} ~ {seconds_to_pace(base + high_offset)}"
 
 
+def decode_schedule(quality_bits: int, easy_bits: int) -> Dict[int, str]:
+    """품질/Easy 요일 비트마스크를 요일 인덱스 → 슬롯 이름 dict로 변환한다 (일요일은 Long)."""
+    schedule: Dict[int, str] = {}
+    for idx in range(7):
+        bit = 1 << idx
+        if bit == LONG_DAY_BIT:
+            schedule[idx] = "Long"
+        elif quality_bits & bit:
+            schedule[idx] = "Quality"
+        elif easy_bits & bit:
+            schedule[idx] = "Easy"
+        else:
+            schedule[idx] = "Rest"
+    return schedule
+
+
 def determine_phase(today: date, race_date: date) -> str:
     weeks_left = max((race_date - today).days / 7.0, 0.0)
-    if weeks_left >= 10:
-        return "BASE"
-    if weeks_left >= 6:
-        return "BUILD"
-    if weeks_left >= 3:
-        return "PEAK"
-    return "TAPER"
+    return PHASES_BY_THRESHOLD[bisect_right(PHASE_WEEK_THRESHOLDS, weeks_left)]
 
 
 # -----------------------------
@@ -128,27 +207,8 @@ def compute_goal_mode(mp_target: float, mp_current: float) -> str:
 
 
 def compute_paces(goal_mode: str, mp_target: float) -> Dict[str, str]:
-    easy_offsets = {
-        "G1": (70, 100),
-        "G2": (55, 85),
-        "G3": (45, 75),
-    }
-    long_offsets = {
-        1: (40, 70),
-        2: (25, 55),
-        3: (15, 45),
-        4: (5, 25),
-    }
-    paces: Dict[str, str] = {
-        "easy": format_range(mp_target, *easy_offsets[goal_mode]),
-        "mp": format_range(mp_target, -5, 5),
-        "tempo": format_range(mp_target, -25, -15),
-        "interval": format_range(mp_target, -65, -40),
-        "taper": format_range(mp_target, 5, 15),
-    }
-    for stage, offsets in long_offsets.items():
-        paces[f"long_{stage}"] = format_range(mp_target, *offsets)
-    return paces
+    offsets = (("easy", *EASY_OFFSETS[goal_mode]),) + PACE_OFFSETS
+    return {key: format_range(mp_target, low, high) for key, low, high in offsets}
 
 
 # -----------------------------
@@ -202,11 +262,7 @@ def build_long_run_session(
     pace_range: str,
     goal_mode: str,
 ) -> DayPlan:
-    mp_ratio = {"G1": 0.0, "G2": 0.2, "G3": 0.3}[goal_mode]
-    if stage == 4:
-        mp_ratio = {"G1": 0.0, "G2": 0.25, "G3": 0.35}[goal_mode]
-    elif stage == 1:
-        mp_ratio = 0.0
+    mp_ratio = LONG_RUN_MP_RATIO[min(max(stage, 1), 4) - 1][GOAL_MODE_INDEX[goal_mode]]
     mp_distance = distance * mp_ratio
     structure = (
         f"{distance - mp_distance:.1f}km Easy-LR + {mp_distance:.1f}km MP finish"
@@ -259,16 +315,20 @@ def apply_safety_overrides(
     easy_pace: str,
 ) -> DayPlan:
     overrides: List[str] = []
+    # Easy로 전환되면 이후 품질 전용 스위치는 적용되지 않으므로 판정 결과를 로컬에 유지한다.
+    is_quality = plan.session_type.startswith("Quality")
     if context.fatigue_streak >= 3:
         overrides.append("피로 3일 연속 → Easy 전환")
         distance = 14.0 if plan.session_type.startswith("Long") else max(plan.distance_km, 8.0)
         plan = build_easy_session(plan.date, plan.weekday, distance, "안전 스위치", easy_pace)
+        is_quality = False
 
-    if context.prev_day_altitude > 300 and plan.session_type.startswith("Quality"):
+    if context.prev_day_altitude > 300 and is_quality:
         overrides.append("전날 고도 >300m → Easy")
         plan = build_easy_session(plan.date, plan.weekday, max(plan.distance_km, 8.0), "고도 회복", easy_pace)
+        is_quality = False
 
-    if fatigue_level >= 7 and plan.session_type.startswith("Quality"):
+    if fatigue_level >= 7 and is_quality:
         overrides.append("피로도 7 이상 → 품질 제한")
         plan = build_easy_session(plan.date, plan.weekday, max(plan.distance_km, 6.0), "High fatigue", easy_pace)
 
@@ -291,8 +351,12 @@ class Planner:
         self.goal_mode = compute_goal_mode(self.mp_target_sec, self.mp_current_sec)
         self.paces = compute_paces(self.goal_mode, self.mp_target_sec)
         self.history = config.long_run_history or [config.recent_long_run]
-        self.stage3_history = sum(1 for d in self.history[-6:] if 26 <= d < 30)
-        self.stage4_history = sum(1 for d in self.history[-6:] if d >= 30)
+        # 최근 6회 롱런을 한 번만 정렬해 Stage3(26~30km)/Stage4(30km+) 횟수를 구간 경계로 센다.
+        recent = sorted(self.history[-6:])
+        stage3_start = bisect_left(recent, 26)
+        stage4_start = bisect_left(recent, 30)
+        self.stage3_history = stage4_start - stage3_start
+        self.stage4_history = len(recent) - stage4_start
         self.weekly_altitude_sum = self.estimate_weekly_altitude()
 
     def estimate_weekly_altitude(self) -> float:
@@ -318,20 +382,11 @@ class Planner:
         return base
 
     def determine_stage(self) -> int:
-        lr = self.config.recent_long_run
-        if self.phase == "BASE":
-            if lr < 22:
-                return 1
+        rule = STAGE_BY_PHASE.get(self.phase)
+        if rule is None:
             return 2
-        if self.phase == "BUILD":
-            if lr < 24:
-                return 2
-            return 3
-        if self.phase == "PEAK":
-            if lr >= 30:
-                return 4
-            return 3
-        return 2
+        threshold, below, at_or_above = rule
+        return at_or_above if self.config.recent_long_run >= threshold else below
 
     def stage_adjustments(self, stage: int, notes: List[str]) -> int:
         stage = min(stage, 4)
@@ -369,24 +424,20 @@ class Planner:
         if self.weeks_left <= 0.5:
             return {0: "Easy", 1: "Strides", 2: "Rest", 3: "Easy", 4: "Rest", 5: "Rest", 6: "Long"}
 
-        plan = {i: "Rest" for i in range(7)}
-        run_days = min(self.config.weekly_frequency, 6)
-        plan[6] = "Long"
-        run_days -= 1
-        assigned_q = 0
-        for idx in QUALITY_DAY_OPTIONS:
-            if assigned_q >= quality_count or run_days <= 0:
-                break
-            plan[idx] = "Quality"
-            assigned_q += 1
-            run_days -= 1
-        i = 0
-        while run_days > 0 and i < 7:
-            if plan[i] == "Rest":
-                plan[i] = "Easy"
-                run_days -= 1
-            i += 1
-        return plan
+        # 요일 배치를 7비트 마스크로 계산한 뒤 마지막에 한 번만 dict로 풀어낸다.
+        run_days = min(self.config.weekly_frequency, 6) - 1  # 일요일 롱런 제외
+        quality_bits = 0
+        for idx in QUALITY_DAY_OPTIONS[: max(min(quality_count, run_days), 0)]:
+            quality_bits |= 1 << idx
+        remaining = run_days - bin(quality_bits).count("1")
+        free_bits = ALL_DAYS_MASK & ~(quality_bits | LONG_DAY_BIT)
+        easy_bits = 0
+        while remaining > 0 and free_bits:
+            lowest = free_bits & -free_bits
+            easy_bits |= lowest
+            free_bits ^= lowest
+            remaining -= 1
+        return decode_schedule(quality_bits, easy_bits)
 
     def long_run_distance(self, stage: int) -> float:
         if self.phase == "TAPER":
@@ -452,27 +503,35 @@ class Planner:
         remaining_easy_km = max(target_km - long_distance - quality_count * 12.0, 0.0)
         easy_default = remaining_easy_km / easy_sessions if easy_sessions else 0.0
 
+        # 루프 안의 반복 속성 조회를 로컬 변수로 고정한다.
+        today = self.config.today
+        fatigue = self.config.fatigue_level
+        default_gain = self.config.recent_weekly_km * 0.5
+        labels = WEEKDAY_LABELS
+        easy_pace = self.paces["easy"]
+        long_pace = self.paces[f"long_{stage}"]
+        goal_mode = self.goal_mode
+        easy_distance = max(easy_default, 6.0)
         for idx in range(7):
-            current_date = self.config.today + timedelta(days=idx)
-            label = WEEKDAY_LABELS[idx]
+            current_date = today + timedelta(days=idx)
+            label = labels[idx]
             slot = schedule.get(idx, "Rest")
             if slot == "Long":
-                plan = build_long_run_session(current_date, label, stage, long_distance, self.paces[f"long_{stage}"], self.goal_mode)
+                plan = build_long_run_session(current_date, label, stage, long_distance, long_pace, goal_mode)
             elif slot == "Quality":
                 plan = self.build_point_session(current_date, label)
             elif slot == "Easy":
-                plan = build_easy_session(current_date, label, max(easy_default, 6.0), "기본 Easy", self.paces["easy"])
+                plan = build_easy_session(current_date, label, easy_distance, "기본 Easy", easy_pace)
             elif slot == "Strides":
-                plan = build_strides_session(current_date, label, self.paces["easy"])
+                plan = build_strides_session(current_date, label, easy_pace)
             else:
                 plan = DayPlan(current_date, label, "Rest / Mobility", 0.0, "-", "Mobility & Stretch", "완전 회복")
 
-            plan = apply_safety_overrides(plan, safety, self.config.fatigue_level, self.paces["easy"])
+            plan = apply_safety_overrides(plan, safety, fatigue, easy_pace)
             plans.append(plan)
 
-            est_alt = estimate_session_altitude(plan, self.config.recent_weekly_km * 0.5)
-            safety.prev_day_altitude = est_alt
-            if plan.session_type.startswith("Easy") or plan.session_type.startswith("Rest"):
+            safety.prev_day_altitude = estimate_session_altitude(plan, default_gain)
+            if plan.session_type.startswith(("Easy", "Rest")):
                 safety.fatigue_streak = 0
             else:
                 safety.fatigue_streak += 1
@@ -482,17 +541,59 @@ class Planner:
         return PlanResult(self.goal_mode, self.phase, target_km, total, notes, plans)
 
     def balance_total_distance(self, plans: List[DayPlan], target: float) -> List[DayPlan]:
-        total = sum(p.distance_km for p in plans)
-        easy_sessions = [p for p in plans if p.session_type.startswith("Easy")]
-        if not easy_sessions or abs(total - target) < 1.0:
+        total = 0.0
+        easy_idx: List[int] = []
+        for idx, plan in enumerate(plans):
+            total += plan.distance_km
+            if plan.session_type.startswith("Easy"):
+                easy_idx.append(idx)
+        if not easy_idx or abs(total - target) < 1.0:
             return plans
-        adjust = (total - target) / len(easy_sessions)
-        for plan in easy_sessions:
+        adjust = (total - target) / len(easy_idx)
+        for idx in easy_idx:
+            plan = plans[idx]
             plan.distance_km = max(plan.distance_km - adjust, 4.0)
             plan.structure = f"Easy jog {plan.distance_km:.1f}km (조정)"
         return plans
 
 
+# -----------------------------
+# 결과 캐시
+# -----------------------------
+
+
+def config_cache_key(config: PlanConfig) -> Tuple[Tuple[str, Any], ...]:
+    """PlanConfig를 (필드 이름, 값) 튜플로 정규화한다 (롱런 히스토리는 튜플로 변환).
+
+    필드 이름으로 키를 만들기 때문에 필드 순서가 바뀌거나 필드가 추가되어도 복원 결과가 어긋나지 않는다.
+    """
+    items = []
+    for f in fields(config):
+        value = getattr(config, f.name)
+        if f.name == "long_run_history":
+            value = tuple(value) if value else None
+        items.append((f.name, value))
+    return tuple(items)
+
+
+@lru_cache(maxsize=128)
+def _build_week_for_key(key: Tuple[Tuple[str, Any], ...]) -> PlanResult:
+    values = dict(key)
+    history = values["long_run_history"]
+    values["long_run_history"] = list(history) if history else None
+    return Planner(PlanConfig(**values)).build_week()
+
+
+def build_week_cached(config: PlanConfig) -> PlanResult:
+    """동일 설정 재조회 시 캐시된 결과의 사본을 돌려준다 (호출자 수정이 캐시에 번지지 않음)."""
+    cached = _build_week_for_key(config_cache_key(config))
+    return replace(
+        cached,
+        notes=list(cached.notes),
+        plans=[replace(plan, safety_overrides=list(plan.safety_overrides)) for plan in cached.plans],
+    )
+
+
 # -----------------------------
 # CLI
 # -----------------------------
@@ -582,15 +683,108 @@ def print_plan(result: PlanResult) -> None:
         print("Notes: " + "; ".join(result.notes))
 
     print("\n=== 요일별 DayPlan ===")
-    for plan in result.plans:
-        print(plan.formatted())
+    if result.plans:
+        sys.stdout.write("\n".join(plan.formatted() for plan in result.plans) + "\n")
 
 
-def main() -> None:
-    config = gather_config_from_cli()
-    planner = Planner(config)
-    result = planner.build_week()
-    print_plan(result)
+def _validated_pace(value: Any, label: str) -> str:
+    # prompt_pace와 같은 기준(pace_to_seconds)으로 mm:ss 형식을 검사한다.
+    if not isinstance(value, str):
+        raise ValueError(f"{label}는 mm:ss 문자열이어야 합니다: {value!r}")
+    try:
+        pace_to_seconds(value)
+    except ValueError:
+        raise ValueError(f"{label} 형식이 올바르지 않습니다 (mm:ss): {value!r}") from None
+    return value
+
+
+def config_from_mapping(values: Dict[str, Any]) -> PlanConfig:
+    """JSON 객체(날짜는 YYYY-MM-DD 문자열)로 PlanConfig를 만든다. 객체가 아니거나 페이스 형식이 잘못되면 ValueError."""
+    if not isinstance(values, dict):
+        raise ValueError(f"설정은 JSON 객체여야 합니다: {values!r}")
+    today = date.fromisoformat(values["today"]) if values.get("today") else date.today()
+    race_raw = values.get("race_date")
+    race_date = date.fromisoformat(race_raw) if race_raw else today + timedelta(days=70)
+    mp_target = _validated_pace(values.get("mp_target") or "05:30", "mp_target")
+    mp_current = _validated_pace(values.get("mp_current") or mp_target, "mp_current")
+    history = values.get("long_run_history")
+    return PlanConfig(
+        today=today,
+        race_date=race_date,
+        recent_weekly_km=float(values.get("recent_weekly_km", 45.0)),
+        recent_long_run=float(values.get("recent_long_run", 18.0)),
+        weekly_frequency=int(values.get("weekly_frequency", 4)),
+        mp_target=mp_target,
+        mp_current=mp_current,
+        fatigue_level=int(values.get("fatigue_level", 3)),
+        long_run_history=[float(d) for d in history] if history else None,
+    )
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="러닝 플래너 v7 (인자 없이 실행하면 대화형 입력)",
+    )
+    parser.add_argument("--today", help="오늘 날짜 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--race-date", help="레이스 날짜 YYYY-MM-DD (기본: 오늘+70일)")
+    parser.add_argument("--recent-weekly-km", type=float, default=45.0)
+    parser.add_argument("--recent-long-run", type=float, default=18.0)
+    parser.add_argument("--weekly-frequency", type=int, default=4)
+    parser.add_argument("--mp-target", default="05:30")
+    parser.add_argument("--mp-current", help="최근 기록 기반 MP (기본: 목표 MP)")
+    parser.add_argument("--fatigue-level", type=int, default=3)
+    parser.add_argument("--history", default="", help="최근 롱런 거리 목록(콤마 구분)")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="stdin에서 한 줄에 하나씩 JSON 설정을 읽어 연속 실행",
+    )
+    return parser
+
+
+def run_batch(lines: Iterable[str]) -> None:
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            config = config_from_mapping(json.loads(line))
+        except (ValueError, TypeError) as exc:
+            # 잘못된 줄은 건너뛰고 나머지 배치는 계속 처리한다.
+            print(f"[{line_no}행] 설정 오류: {exc}", file=sys.stderr)
+            continue
+        print_plan(build_week_cached(config))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        config = gather_config_from_cli()
+        print_plan(Planner(config).build_week())
+        return
+
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.batch:
+        run_batch(sys.stdin)
+        return
+    try:
+        config = config_from_mapping(
+            {
+                "today": args.today,
+                "race_date": args.race_date,
+                "recent_weekly_km": args.recent_weekly_km,
+                "recent_long_run": args.recent_long_run,
+                "weekly_frequency": args.weekly_frequency,
+                "mp_target": args.mp_target,
+                "mp_current": args.mp_current or args.mp_target,
+                "fatigue_level": args.fatigue_level,
+                "long_run_history": parse_history_input(args.history),
+            }
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print_plan(Planner(config).build_week())
 
 
 if __name__ == "__main__":
@@ -16,7 +16,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from planner_notes import append_phase_notes
 
 
 # -----------------------------
@@ -24,7 +29,7 @@ from typing import Any, Dict, List, Optional
 # -----------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DayPlan:
     date: date
     weekday: str
@@ -33,6 +38,8 @@ class DayPlan:
     pace_range: str
     structure: str
     notes: str
+    stage: Optional[int] = None  # 롱런 Stage (롱런 세션에만 설정)
+    kind: str = "R"  # 세션 구분 태그: L(롱런) / Q(품질) / E(Easy) / S(Strides) / R(휴식)
 
     def formatted(self) -> str:
         info = (
@@ -43,7 +50,7 @@ class DayPlan:
         return info + note
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlanConfig:
     race_date: date
     recent_weekly_km: float
@@ -54,7 +61,7 @@ class PlanConfig:
     weekly_training_days: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanResult:
     goal_mode: str
     phase: str
@@ -64,14 +71,78 @@ class PlanResult:
     plans: List[DayPlan]
 
 
+@dataclass(frozen=True)
+class ScheduleLayout:
+    slots: Tuple[str, ...]  # 시작일 기준 7일 슬롯: Long / Quality / Easy / Strides / Rest
+    easy_count: int
+
+
 WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 QUALITY_DAY_OPTIONS = [1, 3, 5]  # Tue/Thu/Sat 기본 품질 슬롯
+SECOND_LABELS = tuple(f"{sec:02d}" for sec in range(60))
+DAY_KEYS = ("date", "weekday", "session_type", "distance_km", "pace_range", "structure", "notes")
+DAY_PLAN_FIELDS = attrgetter(*DAY_KEYS)
+
+# Goal Mode / Phase 코드를 한 번 정수 인덱스로 바꿔 아래 튜플 테이블을 조회한다.
+GOAL_MODE_INDEX = {"G1": 0, "G2": 1, "G3": 2}
+PHASE_INDEX = {"BASE": 0, "BUILD": 1, "PEAK": 2, "TAPER": 3}
+WEEKLY_KM_CAPS = (60.0, 75.0, 82.0)  # G1, G2, G3
+PHASE_VOLUME_FACTORS = (0.70, 0.85, 0.95, 0.60)  # BASE, BUILD, PEAK, TAPER
+EASY_PACE_OFFSETS = ((70, 100), (55, 85), (45, 75))  # G1, G2, G3 (MP 대비 초)
+LONG_PACE_OFFSETS = ((40, 70), (25, 55), (15, 45), (5, 25))  # Stage1~4
+LONG_RUN_MP_RATIOS = (  # Stage1~4 × (G1, G2, G3) 후반 MP 비율
+    (0.0, 0.0, 0.0),
+    (0.0, 0.2, 0.3),
+    (0.0, 0.2, 0.3),
+    (0.0, 0.25, 0.35),
+)
+LONG_RUN_STAGE_KM = (20.0, 24.0, 28.0, 32.0)  # Stage1~4 (TAPER 제외)
+RACE_WEEK_LAYOUT = ScheduleLayout(
+    slots=("Easy", "Strides", "Rest", "Easy", "Rest", "Rest", "Long"),
+    easy_count=2,
+)
+
+
+def build_schedule_layout(weekly_frequency: int, quality_count: int) -> ScheduleLayout:
+    # 일요일 롱런 고정 → 화/목/토 품질 슬롯 → 남은 러닝일을 앞에서부터 Easy로 채운다.
+    plan = ["Rest"] * 7
+    run_days = min(weekly_frequency, 6)
+    plan[6] = "Long"
+    run_days -= 1
+    assigned_q = 0
+    for idx in QUALITY_DAY_OPTIONS:
+        if assigned_q >= quality_count or run_days <= 0:
+            break
+        plan[idx] = "Quality"
+        assigned_q += 1
+        run_days -= 1
+    assigned_easy = 0
+    i = 0
+    while run_days > 0 and i < 7:
+        if plan[i] == "Rest":
+            plan[i] = "Easy"
+            assigned_easy += 1
+            run_days -= 1
+        i += 1
+    return ScheduleLayout(tuple(plan), assigned_easy)
+
+
+# Planner가 만들 수 있는 (주간 빈도 3~6, 품질 0~2) 조합은 import 시 한 번만 계산해 둔다.
+SCHEDULE_LAYOUTS: Dict[Tuple[int, int], ScheduleLayout] = {
+    (frequency, quality): build_schedule_layout(frequency, quality)
+    for frequency in range(3, 7)
+    for quality in range(3)
+}
 
 
 # -----------------------------
 # 보조 함수
 # -----------------------------
 
+# 페이스 헬퍼(pace_to_seconds / seconds_to_pace / format_range)는 주당 수십 회 호출되는
+# 문자열 파싱·포맷 함수라 Numba JIT 대상이 아니다. JIT 디스패치·컴파일 비용이 이득보다 커서
+# 순수 Python으로 유지하고, 반복 호출은 lru_cache(compute_paces 등)로 줄인다.
+
 
 def pace_to_seconds(pace_str: str) -> float:
     minute, sec = pace_str.strip().split(":")
@@ -79,10 +150,9 @@ def pace_to_seconds(pace_str: str) -> float:
 
 
 def seconds_to_pace(sec: float) -> str:
-    sec = max(sec, 0)
-    minute = int(sec // 60)
-    second = int(round(sec % 60))
-    return f"{minute}:{second:02d}/km"
+    # 전체 초를 먼저 반올림해 59.5초 이상이 "m:60"으로 표기되지 않게 한다.
+    minute, second = divmod(int(round(max(sec, 0))), 60)
+    return f"{minute}:{SECOND_LABELS[second]}/km"
 
 
 def format_range(base: float, low_offset: float, high_offset: float) -> str:
@@ -100,9 +170,12 @@ def determine_phase(today: date, race_date: date) -> str:
     return "TAPER"
 
 
-def marathon_time_to_pace(goal_time: str) -> str:
+@lru_cache(maxsize=256)
+def marathon_time_to_pace_seconds(goal_time: str) -> int:
     """
-    Convert a marathon finish time string (HH:MM or HH:MM:SS) into an MP pace string.
+    Convert a marathon finish time string (HH:MM or HH:MM:SS) into MP pace seconds per km.
+    The pace is rounded to whole seconds, matching the MM:SS string form.
+    Results are memoized; invalid inputs raise ValueError every time (not cached).
     """
     parts = goal_time.strip().split(":")
     if not parts or not all(part.isdigit() for part in parts):
@@ -118,8 +191,12 @@ def marathon_time_to_pace(goal_time: str) -> str:
     total_seconds = hours * 3600 + minutes * 60 + seconds
     if total_seconds <= 0:
         raise ValueError("Goal time must be positive")
-    pace_seconds = total_seconds / 42.195
-    return seconds_to_pace(pace_seconds).replace("/km", "")
+    return int(round(total_seconds / 42.195))
+
+
+def marathon_time_to_pace(goal_time: str) -> str:
+    """Convert a marathon finish time string into an MP pace string (MM:SS)."""
+    return seconds_to_pace(marathon_time_to_pace_seconds(goal_time)).replace("/km", "")
 
 
 def derive_weekly_frequency(recent_weekly_km: float) -> int:
@@ -130,9 +207,22 @@ def derive_weekly_frequency(recent_weekly_km: float) -> int:
     return 6
 
 
-def build_long_run_history(recent_long_km: float) -> List[float]:
+@lru_cache(maxsize=256)
+def build_long_run_history(recent_long_km: float) -> Tuple[float, ...]:
     base = max(recent_long_km, 18.0)
-    return [max(base - idx * 2.0, 16.0) for idx in range(4)]
+    return tuple(max(base - idx * 2.0, 16.0) for idx in range(4))
+
+
+@lru_cache(maxsize=256)
+def long_run_stage_history(recent_long_km: float) -> Tuple[int, int]:
+    # 최근 롱런 히스토리 중 Stage3(26~30km) / Stage4(30km 이상) 횟수를 한 번의 순회로 센다.
+    stage3 = stage4 = 0
+    for distance in build_long_run_history(recent_long_km):
+        if distance >= 30:
+            stage4 += 1
+        elif distance >= 26:
+            stage3 += 1
+    return stage3, stage4
 
 
 # -----------------------------
@@ -149,28 +239,20 @@ def compute_goal_mode(mp_target: float, mp_current: float) -> str:
     return "G3"  # 공격형
 
 
-def compute_paces(goal_mode: str, mp_target: float) -> Dict[str, str]:
-    easy_offsets = {
-        "G1": (70, 100),
-        "G2": (55, 85),
-        "G3": (45, 75),
-    }
-    long_offsets = {
-        1: (40, 70),
-        2: (25, 55),
-        3: (15, 45),
-        4: (5, 25),
-    }
+@lru_cache(maxsize=256)
+def compute_paces(goal_mode: str, mp_target: float) -> Mapping[str, str]:
+    # 멀티 주간 플랜에서 같은 (goal_mode, MP) 조합이 매주 반복되므로 결과를 캐시하고,
+    # 공유되는 캐시 값이 변경되지 않도록 읽기 전용 매핑으로 돌려준다.
     paces: Dict[str, str] = {
-        "easy": format_range(mp_target, *easy_offsets[goal_mode]),
+        "easy": format_range(mp_target, *EASY_PACE_OFFSETS[GOAL_MODE_INDEX[goal_mode]]),
         "mp": format_range(mp_target, -5, 5),
         "tempo": format_range(mp_target, -25, -15),
         "interval": format_range(mp_target, -65, -40),
         "taper": format_range(mp_target, 5, 15),
     }
-    for stage, offsets in long_offsets.items():
+    for stage, offsets in enumerate(LONG_PACE_OFFSETS, start=1):
         paces[f"long_{stage}"] = format_range(mp_target, *offsets)
-    return paces
+    return MappingProxyType(paces)
 
 
 # -----------------------------
@@ -193,6 +275,7 @@ def build_easy_session(
         pace_range=pace,
         structure=f"Easy jog {distance:.1f}km",
         notes=notes,
+        kind="E",
     )
 
 
@@ -213,6 +296,7 @@ def build_point_session(
         pace_range=pace_range,
         structure=structure,
         notes=purpose,
+        kind="Q",
     )
 
 
@@ -224,11 +308,7 @@ def build_long_run_session(
     pace_range: str,
     goal_mode: str,
 ) -> DayPlan:
-    mp_ratio = {"G1": 0.0, "G2": 0.2, "G3": 0.3}[goal_mode]
-    if stage == 4:
-        mp_ratio = {"G1": 0.0, "G2": 0.25, "G3": 0.35}[goal_mode]
-    elif stage == 1:
-        mp_ratio = 0.0
+    mp_ratio = LONG_RUN_MP_RATIOS[min(max(stage, 1), 4) - 1][GOAL_MODE_INDEX[goal_mode]]
     mp_distance = distance * mp_ratio
     structure = (
         f"{distance - mp_distance:.1f}km Easy-LR + {mp_distance:.1f}km MP finish"
@@ -244,6 +324,8 @@ def build_long_run_session(
         pace_range=pace_range,
         structure=structure,
         notes=notes,
+        stage=stage,
+        kind="L",
     )
 
 
@@ -256,6 +338,7 @@ def build_strides_session(session_date: date, weekday: str, pace: str) -> DayPla
         pace_range=pace,
         structure="3km Easy + 3×80m strides",
         notes="Race week 리듬 유지",
+        kind="S",
     )
 
 
@@ -267,38 +350,46 @@ def build_strides_session(session_date: date, weekday: str, pace: str) -> DayPla
 class Planner:
     def __init__(self, config: PlanConfig, *, start_date: Optional[date] = None):
         self.config = config
-        self.start_date = start_date or date.today()
-        self.phase = determine_phase(self.start_date, config.race_date)
-        self.weeks_left = max((config.race_date - self.start_date).days / 7.0, 0.0)
+        self.mp_current_sec = pace_to_seconds(config.current_mp)
         try:
-            goal_pace = marathon_time_to_pace(config.goal_marathon_time)
+            self.mp_target_sec = marathon_time_to_pace_seconds(config.goal_marathon_time)
         except ValueError:
-            goal_pace = config.current_mp
-        self.mp_target_sec = pace_to_seconds(goal_pace)
-        self.mp_current_sec = pace_to_seconds(config.current_mp)
+            self.mp_target_sec = self.mp_current_sec
         self.goal_mode = compute_goal_mode(self.mp_target_sec, self.mp_current_sec)
+        self.goal_index = GOAL_MODE_INDEX[self.goal_mode]
         self.paces = compute_paces(self.goal_mode, self.mp_target_sec)
-        base_freq = derive_weekly_frequency(config.recent_weekly_km)
-        if config.weekly_training_days is not None:
-            days = max(3, min(int(config.weekly_training_days), 7))
+        self.history = build_long_run_history(config.recent_long_km)
+        self.stage3_history, self.stage4_history = long_run_stage_history(config.recent_long_km)
+        self.reconfigure(
+            start_date=start_date or date.today(),
+            recent_weekly_km=config.recent_weekly_km,
+        )
+
+    def reconfigure(self, *, start_date: date, recent_weekly_km: float) -> None:
+        """
+        Move the planner to another week without rebuilding goal/pace/history state.
+        Only the start-date and recent-volume dependent fields are recomputed;
+        self.config is left untouched.
+        """
+        self.start_date = start_date
+        self.recent_weekly_km = recent_weekly_km
+        self.phase = determine_phase(start_date, self.config.race_date)
+        self.phase_index = PHASE_INDEX[self.phase]
+        self.weeks_left = max((self.config.race_date - start_date).days / 7.0, 0.0)
+        if self.config.weekly_training_days is not None:
+            days = max(3, min(int(self.config.weekly_training_days), 7))
             self.weekly_frequency = min(days, 6)
         else:
-            self.weekly_frequency = base_freq
-        self.history = build_long_run_history(config.recent_long_km)
-        self.stage3_history = sum(1 for d in self.history[-6:] if 26 <= d < 30)
-        self.stage4_history = sum(1 for d in self.history[-6:] if d >= 30)
+            self.weekly_frequency = derive_weekly_frequency(recent_weekly_km)
 
     def adjusted_target_volume(self) -> float:
         # 부상 여부와 최근 주간 거리 추세를 함께 고려해 목표 볼륨을 산출한다.
-        caps = {"G1": 60.0, "G2": 75.0, "G3": 82.0}
-        phase_factor = {"BASE": 0.70, "BUILD": 0.85, "PEAK": 0.95, "TAPER": 0.60}
-
-        cap = caps[self.goal_mode]
-        theoretical = round(cap * phase_factor[self.phase])
+        cap = WEEKLY_KM_CAPS[self.goal_index]
+        theoretical = round(cap * PHASE_VOLUME_FACTORS[self.phase_index])
         min_volume = 0.9 * theoretical
         max_volume = cap
-        recent = self.config.recent_weekly_km
-        injury = getattr(self.config, "injury_flag", False)
+        recent = self.recent_weekly_km
+        injury = self.config.injury_flag
 
         if recent >= min_volume:
             target = min(max(recent, min_volume), max_volume)
@@ -363,28 +454,12 @@ class Planner:
             return 1 if self.weeks_left > 1.5 else 0
         return 1
 
-    def schedule_days(self, quality_count: int) -> Dict[int, str]:
+    def schedule_days(self, quality_count: int) -> ScheduleLayout:
         if self.weeks_left <= 0.5:
-            return {0: "Easy", 1: "Strides", 2: "Rest", 3: "Easy", 4: "Rest", 5: "Rest", 6: "Long"}
-
-        plan = {i: "Rest" for i in range(7)}
-        run_days = min(self.weekly_frequency, 6)
-        plan[6] = "Long"
-        run_days -= 1
-        assigned_q = 0
-        for idx in QUALITY_DAY_OPTIONS:
-            if assigned_q >= quality_count or run_days <= 0:
-                break
-            plan[idx] = "Quality"
-            assigned_q += 1
-            run_days -= 1
-        i = 0
-        while run_days > 0 and i < 7:
-            if plan[i] == "Rest":
-                plan[i] = "Easy"
-                run_days -= 1
-            i += 1
-        return plan
+            return RACE_WEEK_LAYOUT
+        key = (self.weekly_frequency, quality_count)
+        layout = SCHEDULE_LAYOUTS.get(key)
+        return layout if layout is not None else build_schedule_layout(*key)
 
     def long_run_distance(self, stage: int) -> float:
         if self.phase == "TAPER":
@@ -393,8 +468,9 @@ class Planner:
             if self.weeks_left <= 1.5:
                 return 16.0
             return 22.0
-        table = {1: 20.0, 2: 24.0, 3: 28.0, 4: 32.0}
-        return table.get(stage, 20.0)
+        if 1 <= stage <= len(LONG_RUN_STAGE_KM):
+            return LONG_RUN_STAGE_KM[stage - 1]
+        return 20.0
 
     def build_point_session(self, session_date: date, weekday: str) -> DayPlan:
         if self.phase == "BASE":
@@ -440,16 +516,17 @@ class Planner:
         if self.weeks_left <= 0.5:
             quality_count = 0
 
-        schedule = self.schedule_days(quality_count)
+        layout = self.schedule_days(quality_count)
         plans: List[DayPlan] = []
-        easy_sessions = sum(1 for v in schedule.values() if v == "Easy")
+        easy_plans: List[DayPlan] = []
+        easy_sessions = layout.easy_count
         remaining_easy_km = max(target_km - long_distance - quality_count * 12.0, 0.0)
         easy_default = remaining_easy_km / easy_sessions if easy_sessions else 0.0
 
         for idx in range(7):
             current_date = self.start_date + timedelta(days=idx)
             label = WEEKDAY_LABELS[current_date.weekday()]
-            slot = schedule.get(idx, "Rest")
+            slot = layout.slots[idx]
             if slot == "Long":
                 plan = build_long_run_session(
                     current_date,
@@ -463,39 +540,64 @@ class Planner:
                 plan = self.build_point_session(current_date, label)
             elif slot == "Easy":
                 plan = build_easy_session(current_date, label, max(easy_default, 6.0), "기본 Easy", self.paces["easy"])
+                easy_plans.append(plan)
             elif slot == "Strides":
                 plan = build_strides_session(current_date, label, self.paces["easy"])
+                easy_plans.append(plan)
             else:
                 plan = DayPlan(current_date, label, "Rest / Mobility", 0.0, "-", "Mobility & Stretch", "안전 회복")
 
             plans.append(plan)
 
-        plans = self.balance_total_distance(plans, target_km)
+        plans = self.balance_total_distance(plans, target_km, easy_plans)
         total = sum(p.distance_km for p in plans)
         return PlanResult(self.goal_mode, self.phase, target_km, total, notes, plans)
 
-    def balance_total_distance(self, plans: List[DayPlan], target: float) -> List[DayPlan]:
+    def balance_total_distance(
+        self,
+        plans: List[DayPlan],
+        target: float,
+        easy_sessions: Optional[List[DayPlan]] = None,
+    ) -> List[DayPlan]:
+        # easy_sessions: build_week가 요일 루프에서 모은 Easy 계열 세션 (없으면 plans에서 다시 찾는다)
         total = sum(p.distance_km for p in plans)
-        easy_sessions = [p for p in plans if p.session_type.startswith("Easy")]
+        if easy_sessions is None:
+            easy_sessions = [p for p in plans if p.kind == "E" or p.kind == "S"]
         if not easy_sessions or abs(total - target) < 1.0:
             return plans
         adjust = (total - target) / len(easy_sessions)
         for plan in easy_sessions:
-            plan.distance_km = max(plan.distance_km - adjust, 4.0)
-            plan.structure = f"Easy jog {plan.distance_km:.1f}km (조정)"
+            distance = max(plan.distance_km - adjust, 4.0)
+            # 이미 4km 하한에 걸려 거리가 그대로인 세션은 structure를 다시 쓰지 않는다.
+            if distance != plan.distance_km:
+                plan.distance_km = distance
+                plan.structure = f"Easy jog {distance:.1f}km (조정)"
         return plans
 
 
 
 def generate_week_plan(config: PlanConfig, *, start_date: Optional[date] = None) -> Dict[str, Any]:
-    planner = Planner(config, start_date=start_date)
+    return _week_payload(Planner(config, start_date=start_date))
+
+
+def _day_to_dict(plan: DayPlan) -> Dict[str, Any]:
+    day = dict(zip(DAY_KEYS, DAY_PLAN_FIELDS(plan)))
+    day['date'] = plan.date.isoformat()
+    return day
+
+
+def _week_payload(planner: Planner) -> Dict[str, Any]:
     result = planner.build_week()
-    quality_sessions = sum(1 for plan in result.plans if plan.session_type.startswith('Quality'))
-    long_run = next((plan for plan in result.plans if plan.session_type.startswith('Long')), None)
+    quality_sessions = 0
+    long_run = None
+    for plan in result.plans:
+        kind = plan.kind
+        if kind == 'Q':
+            quality_sessions += 1
+        elif long_run is None and kind == 'L':
+            long_run = plan
     long_distance = long_run.distance_km if long_run else 0.0
-    long_stage = ''
-    if long_run and 'Stage' in long_run.session_type:
-        long_stage = long_run.session_type.split('Stage')[-1].strip(' )')
+    long_stage = str(long_run.stage) if long_run and long_run.stage else ''
     summary = {
         'phase': result.phase,
         'goal_mode': result.goal_mode,
@@ -506,40 +608,16 @@ def generate_week_plan(config: PlanConfig, *, start_date: Optional[date] = None)
         'long_run_stage': long_stage,
     }
     notes = list(result.notes)
-    recent_km = config.recent_weekly_km
-    planned_km = result.total_planned_km
-    if recent_km > 0:
-        ratio = planned_km / recent_km
-        if ratio >= 1.25:
-            # 지난 주 대비 과도한 주간 거리 증가 시 경고 메모를 추가한다.
-            notes.append("지난 주 대비 주간 거리가 25% 이상 증가했습니다. 피로도·통증을 점검하고 필요 시 거리를 줄여 주세요.")
-    phase_focus = {
-        'BASE': "BASE Phase: 에어로빅 베이스와 Easy 러닝 비율을 충분히 확보하는 주입니다. 페이스보다는 거리와 주간 리듬에 집중해 주세요.",
-        'BUILD': "BUILD Phase: 품질 세션 후 회복일을 충분히 확보하면서, 롱런 후반 집중도를 점차 올리는 주입니다.",
-        'PEAK': "PEAK Phase: 레이스 페이스 감각을 키우는 것이 핵심입니다. 롱런과 포인트 훈련에서 식이·보급·페이스 전략을 리허설해 보세요.",
-        'TAPER': "TAPER Phase: 볼륨을 줄이고 회복을 극대화하는 구간입니다. 수면·영양·스트레스 관리를 우선시해 주세요.",
-    }
-    phase_note = phase_focus.get(result.phase)
-    if phase_note:
-        notes.append(phase_note)
-    if quality_sessions == 0:
-        notes.append("이번 주는 품질 세션 없이 회복 중심 주간입니다. Easy 페이스에서 부상 신호를 체크해 주세요.")
-    elif quality_sessions >= 2:
-        notes.append("품질 세션이 2회 이상인 주간입니다. 세션 사이 회복일의 수면·영양 관리에 특히 신경 써 주세요.")
-    if long_stage in {'3', '4'} and long_distance >= 28.0:
-        notes.append(f"이번 롱런은 Stage{long_stage} 단계로, 레이스 시뮬레이션에 가까운 강도입니다. 보급 계획과 페이스 전략을 미리 연습해 보세요.")
-    days = [
-        {
-            'date': plan.date.isoformat(),
-            'weekday': plan.weekday,
-            'session_type': plan.session_type,
-            'distance_km': plan.distance_km,
-            'pace_range': plan.pace_range,
-            'structure': plan.structure,
-            'notes': plan.notes,
-        }
-        for plan in result.plans
-    ]
+    append_phase_notes(
+        notes,
+        phase=result.phase,
+        recent_km=planner.recent_weekly_km,
+        planned_km=result.total_planned_km,
+        quality_sessions=quality_sessions,
+        long_stage=long_stage,
+        long_distance=long_distance,
+    )
+    days = list(map(_day_to_dict, result.plans))
     return {'summary': summary, 'days': days, 'notes': notes}
 
 
@@ -566,33 +644,33 @@ def generate_multi_week_plan_v1_2(
     if start_date > race_date:
         raise ValueError("start_date must be on or before race_date")
     actual_weekly_km = actual_weekly_km or []
-    weeks: List[Dict[str, Any]] = []
-    idx = 0
-    current_start = start_date
+    actual_count = len(actual_weekly_km)
+    # 레이스 주까지의 주차 수는 미리 정해지므로 결과 리스트를 한 번에 잡아 둔다.
+    num_weeks = (race_date - start_date).days // 7 + 1
+    weeks: List[Optional[Dict[str, Any]]] = [None] * num_weeks
+    week_starts = (start_date + timedelta(days=7 * i) for i in range(num_weeks))
     recent = base_config.recent_weekly_km
-    while current_start <= race_date:
+    # 목표 페이스·롱런 히스토리는 주차와 무관하므로 Planner 하나를 재사용한다.
+    planner = Planner(base_config, start_date=start_date)
+    for idx, current_start in enumerate(week_starts):
         current_end = min(current_start + timedelta(days=6), race_date)
-        week_config = replace(base_config, recent_weekly_km=recent)
-        week_plan = generate_week_plan(week_config, start_date=current_start)
-        actual_this_week = actual_weekly_km[idx] if idx < len(actual_weekly_km) else None
-        weeks.append(
-            {
-                'index': idx,
-                'start_date': current_start,
-                'end_date': current_end,
-                'summary': week_plan['summary'],
-                'days': week_plan['days'],
-                'notes': week_plan['notes'],
-                'recent_weekly_km_used': recent,
-                'actual_weekly_km': actual_this_week,
-            }
-        )
+        planner.reconfigure(start_date=current_start, recent_weekly_km=recent)
+        week_plan = _week_payload(planner)
+        actual_this_week = actual_weekly_km[idx] if idx < actual_count else None
+        weeks[idx] = {
+            'index': idx,
+            'start_date': current_start,
+            'end_date': current_end,
+            'summary': week_plan['summary'],
+            'days': week_plan['days'],
+            'notes': week_plan['notes'],
+            'recent_weekly_km_used': recent,
+            'actual_weekly_km': actual_this_week,
+        }
         if actual_this_week is not None:
             recent = actual_this_week
         else:
             recent = week_plan['summary']['planned_weekly_km']
-        current_start += timedelta(days=7)
-        idx += 1
     config_snapshot = {
         'race_date': base_config.race_date,
         'start_date': start_date,
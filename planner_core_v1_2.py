@@ -11,18 +11,23 @@ from dataclasses import replace
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional
 
-from planner_core import PlanConfig, Planner, WEEKDAY_LABELS
+from planner_core import PlanConfig, Planner
+from planner_notes import append_phase_notes
 
 
 def _build_week_payload(config: PlanConfig, *, start_date: Optional[date]) -> Dict[str, Any]:
     planner = Planner(config, start_date=start_date)
     result = planner.build_week()
-    quality_sessions = sum(1 for plan in result.plans if plan.session_type.startswith("Quality"))
-    long_run = next((plan for plan in result.plans if plan.session_type.startswith("Long")), None)
+    quality_sessions = 0
+    long_run = None
+    for plan in result.plans:
+        kind = plan.kind
+        if kind == "Q":
+            quality_sessions += 1
+        elif long_run is None and kind == "L":
+            long_run = plan
     long_distance = long_run.distance_km if long_run else 0.0
-    long_stage = ""
-    if long_run and "Stage" in long_run.session_type:
-        long_stage = long_run.session_type.split("Stage")[-1].strip(" )")
+    long_stage = str(long_run.stage) if long_run and long_run.stage else ""
     summary = {
         "phase": result.phase,
         "goal_mode": result.goal_mode,
@@ -33,34 +38,21 @@ def _build_week_payload(config: PlanConfig, *, start_date: Optional[date]) -> Di
         "long_run_stage": long_stage,
     }
     notes = list(result.notes)
-    recent_km = config.recent_weekly_km
-    planned_km = result.total_planned_km
-    if recent_km > 0:
-        ratio = planned_km / recent_km
-        if ratio >= 1.25:
-            notes.append("지난 주 대비 주간 거리가 25% 이상 증가했습니다. 피로도·통증을 점검하고 필요 시 거리를 줄여 주세요.")
-    phase_focus = {
-        "BASE": "BASE Phase: 에어로빅 베이스와 Easy 러닝 비율을 충분히 확보하는 주입니다. 페이스보다는 거리와 주간 리듬에 집중해 주세요.",
-        "BUILD": "BUILD Phase: 품질 세션 후 회복일을 충분히 확보하면서, 롱런 후반 집중도를 점차 올리는 주입니다.",
-        "PEAK": "PEAK Phase: 레이스 페이스 감각을 키우는 것이 핵심입니다. 롱런과 포인트 훈련에서 식이·보급·페이스 전략을 리허설해 보세요.",
-        "TAPER": "TAPER Phase: 볼륨을 줄이고 회복을 극대화하는 구간입니다. 수면·영양·스트레스 관리를 우선시해 주세요.",
-    }
-    phase_note = phase_focus.get(result.phase)
-    if phase_note:
-        notes.append(phase_note)
-    if quality_sessions == 0:
-        notes.append("이번 주는 품질 세션 없이 회복 중심 주간입니다. Easy 페이스에서 부상 신호를 체크해 주세요.")
-    elif quality_sessions >= 2:
-        notes.append("품질 세션이 2회 이상인 주간입니다. 세션 사이 회복일의 수면·영양 관리에 특히 신경 써 주세요.")
-    if long_stage in {"3", "4"} and long_distance >= 28.0:
-        notes.append("이번 롱런은 Stage{0} 단계로, 레이스 시뮬레이션에 가까운 강도입니다. 보급 계획과 페이스 전략을 미리 연습해 보세요.".format(long_stage))
+    append_phase_notes(
+        notes,
+        phase=result.phase,
+        recent_km=config.recent_weekly_km,
+        planned_km=result.total_planned_km,
+        quality_sessions=quality_sessions,
+        long_stage=long_stage,
+        long_distance=long_distance,
+    )
     days = []
     for plan in result.plans:
-        weekday_label = WEEKDAY_LABELS[plan.date.weekday()]
         days.append(
             {
                 "date": plan.date.isoformat(),
-                "weekday": weekday_label,
+                "weekday": plan.weekday,
                 "session_type": plan.session_type,
                 "distance_km": plan.distance_km,
                 "pace_range": plan.pace_range,
@@ -0,0 +1,52 @@
+"""
+planner_notes
+-------------
+주간 플랜 payload에 붙는 코치 메모 문구 모음.
+planner_core.py(기본 엔진)와 planner_core_v1_2.py가 같은 문구를 공유한다.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Final, List, Mapping
+
+
+# 주간 메모 문구 (주마다 다시 만들지 않도록 모듈 상수로 둔다)
+PHASE_FOCUS_NOTES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "BASE": "BASE Phase: 에어로빅 베이스와 Easy 러닝 비율을 충분히 확보하는 주입니다. 페이스보다는 거리와 주간 리듬에 집중해 주세요.",
+        "BUILD": "BUILD Phase: 품질 세션 후 회복일을 충분히 확보하면서, 롱런 후반 집중도를 점차 올리는 주입니다.",
+        "PEAK": "PEAK Phase: 레이스 페이스 감각을 키우는 것이 핵심입니다. 롱런과 포인트 훈련에서 식이·보급·페이스 전략을 리허설해 보세요.",
+        "TAPER": "TAPER Phase: 볼륨을 줄이고 회복을 극대화하는 구간입니다. 수면·영양·스트레스 관리를 우선시해 주세요.",
+    }
+)
+VOLUME_JUMP_NOTE: Final = "지난 주 대비 주간 거리가 25% 이상 증가했습니다. 피로도·통증을 점검하고 필요 시 거리를 줄여 주세요."
+NO_QUALITY_NOTE: Final = "이번 주는 품질 세션 없이 회복 중심 주간입니다. Easy 페이스에서 부상 신호를 체크해 주세요."
+MULTI_QUALITY_NOTE: Final = "품질 세션이 2회 이상인 주간입니다. 세션 사이 회복일의 수면·영양 관리에 특히 신경 써 주세요."
+LONG_STAGE_NOTE: Final = "이번 롱런은 Stage{0} 단계로, 레이스 시뮬레이션에 가까운 강도입니다. 보급 계획과 페이스 전략을 미리 연습해 보세요."
+VOLUME_JUMP_RATIO: Final = 1.25
+LONG_STAGE_NOTE_KM: Final = 28.0
+
+
+def append_phase_notes(
+    notes: List[str],
+    *,
+    phase: str,
+    recent_km: float,
+    planned_km: float,
+    quality_sessions: int,
+    long_stage: str,
+    long_distance: float,
+) -> None:
+    if recent_km > 0 and planned_km / recent_km >= VOLUME_JUMP_RATIO:
+        # 지난 주 대비 과도한 주간 거리 증가 시 경고 메모를 추가한다.
+        notes.append(VOLUME_JUMP_NOTE)
+    phase_note = PHASE_FOCUS_NOTES.get(phase)
+    if phase_note:
+        notes.append(phase_note)
+    if quality_sessions == 0:
+        notes.append(NO_QUALITY_NOTE)
+    elif quality_sessions >= 2:
+        notes.append(MULTI_QUALITY_NOTE)
+    if long_stage in ("3", "4") and long_distance >= LONG_STAGE_NOTE_KM:
+        notes.append(LONG_STAGE_NOTE.format(long_stage))
@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+import os
+import sys
+
+import pytest
+
+# 저장소 루트를 한 번만 sys.path에 추가한다 (문자열 연산만 사용, 파일시스템 resolve 없음).
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from planner_core import PlanConfig
+from planner_core_v1_1 import PlanConfigV11
+
+
+BASE_START = date(2025, 1, 6)
+
+
+@pytest.fixture(scope="session")
+def base_start() -> date:
+    # 모든 테스트 모듈이 공유하는 기준 주 시작일 (월요일)
+    return BASE_START
+
+
+@pytest.fixture(scope="session")
+def base_plan_config_v11() -> PlanConfigV11:
+    return PlanConfigV11(
+        race_date=BASE_START + timedelta(weeks=12),
+        recent_weekly_km=60.0,
+        recent_long_km=24.0,
+        goal_marathon_time="03:30:00",
+        current_mp="05:10",
+        injury_flag=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def base_plan_config() -> PlanConfig:
+    # 기본 엔진(planner_core)과 v1.2 래퍼가 같은 PlanConfig를 쓴다.
+    return PlanConfig(
+        race_date=BASE_START + timedelta(weeks=12),
+        recent_weekly_km=60.0,
+        recent_long_km=24.0,
+        goal_marathon_time="03:30:00",
+        current_mp="05:10",
+        injury_flag=False,
+    )
@@ -1,19 +1,16 @@
-from dataclasses import replace
+from dataclasses import FrozenInstanceError, replace
 from datetime import date, timedelta
-from pathlib import Path
-import sys
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 from planner_core import (
+    DayPlan,
     PlanConfig,
+    Planner,
     generate_multi_week_plan_v1_2,
     generate_week_plan,
     generate_week_plan_v1_2,
+    seconds_to_pace,
 )
 
 
@@ -40,6 +37,33 @@ def test_generate_week_plan_returns_full_week() -> None:
     assert plan["summary"]["quality_sessions"] >= 1
 
 
+def test_plan_config_is_frozen_and_hashable() -> None:
+    config = build_config()
+
+    assert hash(config) == hash(build_config())
+    with pytest.raises(FrozenInstanceError):
+        config.recent_weekly_km = 10.0  # type: ignore[misc]
+
+
+def test_seconds_to_pace_rolls_over_to_next_minute() -> None:
+    assert seconds_to_pace(299.6) == "5:00/km"
+    assert seconds_to_pace(305.0) == "5:05/km"
+    assert seconds_to_pace(-3.0) == "0:00/km"
+
+
+def test_balance_keeps_structure_of_sessions_at_distance_floor() -> None:
+    planner = Planner(build_config(), start_date=BASE_START)
+    strides = DayPlan(BASE_START, "Mon", "Easy + Strides", 4.0, "", "3km Easy + 3×80m strides", "")
+    easy = DayPlan(BASE_START, "Tue", "Easy", 10.0, "", "Easy jog 10.0km", "")
+
+    planner.balance_total_distance([strides, easy], 10.0, [strides, easy])
+
+    assert strides.distance_km == 4.0
+    assert strides.structure == "3km Easy + 3×80m strides"
+    assert easy.distance_km == 8.0
+    assert easy.structure == "Easy jog 8.0km (조정)"
+
+
 def test_goal_mode_g1_limits_quality_sessions() -> None:
     config = build_config(goal_marathon_time="03:50:00")
     plan = generate_week_plan(config, start_date=BASE_START)
@@ -192,6 +216,19 @@ def test_multi_week_uses_actual_values_when_provided() -> None:
     assert weeks[1]["actual_weekly_km"] == pytest.approx(actuals[1])
 
 
+def test_planner_reconfigure_matches_fresh_planner() -> None:
+    config = build_config(recent_weekly_km=60.0)
+    next_start = BASE_START + timedelta(weeks=5)
+    planner = Planner(config, start_date=BASE_START)
+    planner.reconfigure(start_date=next_start, recent_weekly_km=35.0)
+    fresh = Planner(replace(config, recent_weekly_km=35.0), start_date=next_start)
+
+    assert planner.phase == fresh.phase
+    assert planner.weekly_frequency == fresh.weekly_frequency
+    assert planner.build_week() == fresh.build_week()
+    assert config.recent_weekly_km == 60.0
+
+
 def test_single_week_plan_returned_when_race_within_same_week() -> None:
     config = build_config()
     race_date = BASE_START + timedelta(days=3)
@@ -5,12 +5,6 @@ Copied from tests/test_planner_core.py during promotion.
 
 from dataclasses import replace
 from datetime import date, timedelta
-from pathlib import Path
-import sys
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
 
 from planner_core_v1_0 import PlanConfig, generate_week_plan
 
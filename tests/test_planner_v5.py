@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+
+from legacy_versions.planner_v5 import PlanConfig, generate_macro_plan
+
+
+@pytest.fixture(scope="module")
+def macro_plan():
+    # 2025-01-06(월) 시작, 레이스는 13주 차 일요일
+    config = PlanConfig(
+        today=date(2025, 1, 6),
+        race_date=date(2025, 4, 6),
+        recent_weekly_km=50.0,
+        recent_long_run=20.0,
+        weekly_frequency=5,
+        fatigue_level=3,
+    )
+    return generate_macro_plan(config)
+
+
+def test_macro_plan_has_one_row_per_week_until_race(macro_plan) -> None:
+    assert len(macro_plan) == 13
+    assert macro_plan[0].week_start == date(2025, 1, 6)
+    assert macro_plan[-1].week_start == date(2025, 3, 31)
+
+
+def test_macro_plan_phase_sequence(macro_plan) -> None:
+    phases = [week.phase for week in macro_plan]
+
+    assert phases == ["BASE"] * 3 + ["BUILD"] * 4 + ["PEAK"] * 3 + ["TAPER"] * 3
+
+
+def test_macro_plan_carries_long_run_forward(macro_plan) -> None:
+    long_runs = [week.long_run_km for week in macro_plan]
+
+    # 직전 주 롱런이 다음 주 입력이 되므로 BUILD 구간에서 롱런이 단계적으로 늘고 PEAK에서 32km가 한 번 나온다.
+    assert long_runs[3:6] == [22.0, 24.0, 26.0]
+    assert long_runs[7:10].count(32.0) == 1
@@ -0,0 +1,132 @@
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from legacy_versions.planner_v6 import (
+    DayPlan,
+    PlanConfig,
+    Planner,
+    SafetyContext,
+    SessionKind,
+    apply_safety_overrides,
+    session_kind_for,
+)
+
+
+BASE_CONFIG = PlanConfig(
+    today=date(2025, 1, 6),
+    race_date=date(2025, 3, 30),
+    phase="BUILD",
+    recent_weekly_km=60.0,
+    recent_long_run=24.0,
+    weekly_frequency=5,
+    mp_target="05:00",
+    mp_current="05:10",
+    fatigue_level=3,
+    altitude_gain_recent=300.0,
+)
+
+# 요일(Mon~Sun)별 세션 코드: R=Rest, E=Easy, Q=Quality, L=Long
+_KIND_CODES = {"R": SessionKind.REST, "E": SessionKind.EASY, "Q": SessionKind.QUALITY, "L": SessionKind.LONG}
+
+
+def _quality_day(**overrides) -> DayPlan:
+    fields = dict(
+        date=date(2025, 1, 7),
+        weekday="Tue",
+        session_type="Quality - Tempo",
+        distance_km=12.0,
+        pace_range="4:40/km ~ 4:50/km",
+        structure="Tempo 8km",
+        notes="",
+    )
+    fields.update(overrides)
+    return DayPlan(**fields)
+
+
+def _safety_context(**overrides) -> SafetyContext:
+    fields = dict(pain_48h=False, fatigue_streak=0, prev_day_altitude=0.0, hr_delta_percent=None)
+    fields.update(overrides)
+    return SafetyContext(**fields)
+
+
+@pytest.mark.parametrize(
+    ("session_type", "expected"),
+    [
+        ("Long Run (Stage 2)", SessionKind.LONG),
+        ("Quality - Tempo", SessionKind.QUALITY),
+        ("Easy Run", SessionKind.EASY),
+        ("Rest / Mobility", SessionKind.REST),
+        ("Cross Training", SessionKind.OTHER),
+    ],
+)
+def test_session_kind_follows_session_name(session_type, expected) -> None:
+    assert session_kind_for(session_type) is expected
+    plan = DayPlan(date(2025, 1, 6), "Mon", session_type, 0.0, "-", "", "")
+    assert plan.kind is expected
+
+
+@pytest.mark.parametrize(
+    ("weekly_frequency", "quality_count", "expected"),
+    [
+        (1, 2, "RRRRRRL"),
+        (2, 2, "RQRRRRL"),
+        (3, 1, "EQRRRRL"),
+        (3, 2, "RQRQRRL"),
+        (4, 2, "EQRQRRL"),
+        (5, 0, "EEEERRL"),
+        (5, 2, "EQEQRRL"),
+        (6, 2, "EQEQERL"),
+        (7, 2, "EQEQERL"),  # 주 6회 상한
+    ],
+)
+def test_schedule_days_per_weekly_frequency(weekly_frequency, quality_count, expected) -> None:
+    planner = Planner(replace(BASE_CONFIG, weekly_frequency=weekly_frequency))
+
+    schedule = planner.schedule_days(quality_count)
+
+    assert list(schedule) == [_KIND_CODES[code] for code in expected]
+
+
+@pytest.mark.parametrize(
+    ("context_overrides", "fatigue_level", "reason"),
+    [
+        ({"fatigue_streak": 3}, 3, "3일 연속 피로 → Easy 전환"),
+        ({"prev_day_altitude": 350.0}, 3, "전날 고도 >300m → Easy 전환"),
+        ({"hr_delta_percent": 9.0}, 3, "HR +8% → 품질 금지"),
+        ({}, 7, "피로도 7 이상 → 품질 금지"),
+    ],
+)
+def test_safety_switch_downgrades_quality_to_easy(context_overrides, fatigue_level, reason) -> None:
+    plan = apply_safety_overrides(_quality_day(), _safety_context(**context_overrides), fatigue_level)
+
+    assert plan.kind is SessionKind.EASY
+    assert plan.session_type == "Easy Run"
+    # 처음 걸린 스위치 하나만 기록된다.
+    assert plan.safety_overrides == [reason]
+
+
+def test_safety_switch_leaves_non_quality_sessions_alone() -> None:
+    easy = _quality_day(session_type="Easy Run", structure="Easy jog 8.0km")
+
+    plan = apply_safety_overrides(easy, _safety_context(fatigue_streak=5), 8)
+
+    assert plan.kind is SessionKind.EASY
+    assert plan.safety_overrides == []
+
+
+def test_pain_in_last_48h_turns_whole_week_into_rest() -> None:
+    result = Planner(replace(BASE_CONFIG, pain_last_48h=True)).build_week()
+
+    assert all(plan.kind is SessionKind.REST for plan in result.plans)
+    assert all(plan.distance_km == 0.0 for plan in result.plans)
+    assert all(plan.safety_overrides == ["48시간 통증 → 강훈 금지"] for plan in result.plans)
+
+
+def test_high_fatigue_week_has_no_quality_sessions() -> None:
+    result = Planner(replace(BASE_CONFIG, fatigue_level=8)).build_week()
+
+    kinds = [plan.kind for plan in result.plans]
+    assert SessionKind.QUALITY not in kinds
+    assert kinds.count(SessionKind.LONG) == 1
@@ -0,0 +1,46 @@
+from datetime import date
+
+import pytest
+
+from legacy_versions.planner_v7 import (
+    PlanConfig,
+    Planner,
+    build_week_cached,
+    config_from_mapping,
+    run_batch,
+)
+
+
+@pytest.mark.parametrize("history", [None, [24.0, 26.0, 28.0]], ids=["no_history", "with_history"])
+def test_build_week_cached_matches_uncached(history) -> None:
+    config = PlanConfig(
+        today=date(2025, 1, 6),
+        race_date=date(2025, 3, 2),
+        recent_weekly_km=55.0,
+        recent_long_run=24.0,
+        weekly_frequency=5,
+        mp_target="05:00",
+        mp_current="05:10",
+        fatigue_level=3,
+        long_run_history=history,
+    )
+
+    # 두 번째 호출은 캐시에서 복원한 설정으로 계산한 결과를 돌려준다.
+    build_week_cached(config)
+    assert build_week_cached(config) == Planner(config).build_week()
+
+
+def test_config_from_mapping_falls_back_to_target_for_null_current_pace() -> None:
+    config = config_from_mapping({"today": "2025-01-06", "mp_target": "05:00", "mp_current": None})
+
+    assert config.mp_current == "05:00"
+
+
+def test_run_batch_reports_bad_line_and_continues(capsys) -> None:
+    run_batch(['{"today": "2025-01-06", "mp_target": "abc"}', "[1, 2]", '"x"', '{"today": "2025-01-06"}'])
+
+    captured = capsys.readouterr()
+    assert "[1행] 설정 오류" in captured.err
+    assert "[2행] 설정 오류" in captured.err
+    assert "[3행] 설정 오류" in captured.err
+    assert captured.out.count("=== 주간 개요 ===") == 1